@@ -36,6 +36,11 @@ OUTPUT_DIR = "output"
 CONFIG_FILE = "config.ini"
 CONFIG_SECTION = "deepl"
 CONFIG_KEY = "api_key"
+# 日志区最多保留的行数，超出后裁掉最早的部分
+LOG_MAX_LINES = 5000
+LOG_TRIM_TO_LINES = 1000
+# 日志轮询间隔（毫秒）
+LOG_POLL_MS = 20
 
 
 class GuiApp(tk.Tk):
@@ -60,10 +65,12 @@ class GuiApp(tk.Tk):
         self._load_config()
 
         # 启动日志轮询
-        self.after(100, self._poll_log_queue)
+        self.after(LOG_POLL_MS, self._poll_log_queue)
 
     def _build_ui(self):
         pad = {"padx": 10, "pady": 6}
+        # 任务运行时需要禁用的交互控件
+        self._toggleable: list[tk.Widget] = []
 
         # API Key 区域
         api_frame = ttk.LabelFrame(self, text="DeepL API Key")
@@ -78,6 +85,7 @@ class GuiApp(tk.Tk):
 
         test_btn = ttk.Button(api_frame, text="Test API Key", command=self._on_test_api)
         test_btn.grid(row=0, column=4, padx=8, pady=8, sticky="e")
+        self._toggleable.extend((entry, save_btn, test_btn))
 
         # 说明
         flow_frame = ttk.LabelFrame(self, text="Workflow")
@@ -98,12 +106,14 @@ class GuiApp(tk.Tk):
             variable=self.overwrite_var,
         )
         overwrite_cb.pack(anchor="w")
+        self._toggleable.append(overwrite_cb)
 
         # 开始按钮
         action_frame = ttk.Frame(self)
         action_frame.pack(fill=tk.X, **pad)
         self.start_btn = ttk.Button(action_frame, text="Start Batch Translation", command=self._on_start)
         self.start_btn.pack(pady=4)
+        self._toggleable.append(self.start_btn)
 
         # 日志区域
         log_frame = ttk.LabelFrame(self, text="Logs & Status")
@@ -180,7 +190,7 @@ class GuiApp(tk.Tk):
                     input_dir=INPUT_DIR,
                     output_dir=OUTPUT_DIR,
                     overwrite_existing=overwrite,
-                    logger=lambda m: self.log_queue.put(m),
+                    logger=self.log_queue.put,
                 )
                 self.log_queue.put(
                     f"Summary: files {summary['files']}, rows {summary['rows']}, "
@@ -197,32 +207,35 @@ class GuiApp(tk.Tk):
     # UI 辅助
     def _disable_controls(self, busy: bool):
         state = "disabled" if busy else "normal"
-        for child in self.winfo_children():
-            # 只禁用主要交互控件，日志不禁
-            if isinstance(child, ttk.Labelframe) or isinstance(child, ttk.Frame):
-                for sub in child.winfo_children():
-                    if sub is self.log_text:
-                        continue
-                    try:
-                        sub.configure(state=state)
-                    except tk.TclError:
-                        pass
-        # 单独设置开始按钮
-        try:
-            self.start_btn.configure(state=state)
-        except Exception:
-            pass
+        for w in self._toggleable:
+            try:
+                w.configure(state=state)
+            except tk.TclError:
+                pass
 
     def _log(self, msg: str):
+        self._append_log([msg])
+
+    def _append_log(self, lines: list[str]):
+        # 一次 insert + 一次 see，避免逐条重绘
         self.log_text.configure(state="normal")
-        self.log_text.insert(tk.END, msg + "\n")
+        self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+        line_count = int(self.log_text.index("end-1c").split(".")[0])
+        if line_count > LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"end-{LOG_TRIM_TO_LINES}l")
         self.log_text.see(tk.END)
         self.log_text.configure(state="disabled")
 
     def _poll_log_queue(self):
+        buf: list[str] = []
         try:
             while True:
                 msg = self.log_queue.get_nowait()
+                if msg in ("__ENABLE__", "__ALERT_OK__", "__ALERT_FAIL__"):
+                    # 先输出之前积累的日志，保持顺序
+                    if buf:
+                        self._append_log(buf)
+                        buf = []
                 if msg == "__ENABLE__":
                     self._disable_controls(False)
                 elif msg == "__ALERT_OK__":
@@ -230,10 +243,12 @@ class GuiApp(tk.Tk):
                 elif msg == "__ALERT_FAIL__":
                     messagebox.showerror("API Test", "API Key invalid or connection failed.")
                 else:
-                    self._log(msg)
+                    buf.append(msg)
         except queue.Empty:
             pass
-        self.after(100, self._poll_log_queue)
+        if buf:
+            self._append_log(buf)
+        self.after(LOG_POLL_MS, self._poll_log_queue)
 
 
 if __name__ == "__main__":
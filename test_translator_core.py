@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_translator_core.py
+
+translator_core 的单元测试（无需 deepl / 网络）。
+
+运行：
+  python -m unittest test_translator_core
+"""
+
+import os
+import re
+import tempfile
+import unittest
+
+from translator_core import (
+    DEEPL_BATCH_SIZE,
+    DEEPL_MAX_REQUEST_BYTES,
+    is_skippable_source,
+    iter_batches,
+    load_csv,
+    write_csv,
+)
+
+# 合并为 SKIP_RE 之前的三个正则与判定逻辑，用作对照
+_OLD_URL_RE = re.compile(r"^(https?://|www\.)", re.IGNORECASE)
+_OLD_ONLY_PUNCT_OR_SPACE_RE = re.compile(r"^[\W_]+$", re.UNICODE)
+_OLD_ONLY_DIGITS_RE = re.compile(r"^\d+(\.\d+)?$")
+
+
+def _old_is_skippable_source(text):
+    if text is None:
+        return True
+    t = text.strip()
+    if not t:
+        return True
+    if _OLD_URL_RE.match(t):
+        return True
+    if _OLD_ONLY_DIGITS_RE.match(t):
+        return True
+    if _OLD_ONLY_PUNCT_OR_SPACE_RE.match(t):
+        return True
+    return False
+
+
+CASES = [
+    # 空 / 空白
+    (None, True),
+    ("", True),
+    ("   ", True),
+    (" \t\n ", True),
+    ("　", True),
+    # URL
+    ("http://example.com", True),
+    ("  HTTPS://example.com/path ", True),
+    ("www.example.com", True),
+    ("WWW.Example.com", True),
+    ("see http://example.com", False),
+    # 整数 / 小数
+    ("42", True),
+    (" 3.14 ", True),
+    ("1.", False),
+    (".5", False),
+    ("1.2.3", False),
+    ("12 34", False),
+    # 纯标点
+    ("?!", True),
+    (" ... ", True),
+    ("___", True),
+    ("- / -", True),
+    # 普通文本 / 混合
+    ("Hello", False),
+    ("Hello {0}", False),
+    ("Level 3", False),
+    ("3 apples", False),
+    ("!Go!", False),
+    ("中文", False),
+    ("\nStart\n", False),
+]
+
+
+class IsSkippableSourceTest(unittest.TestCase):
+    def test_matches_previous_three_regex_logic(self):
+        for text, _ in CASES:
+            with self.subTest(text=text):
+                self.assertEqual(is_skippable_source(text), _old_is_skippable_source(text))
+
+    def test_expected_values(self):
+        for text, expected in CASES:
+            with self.subTest(text=text):
+                self.assertEqual(is_skippable_source(text), expected)
+
+
+class CsvRoundTripTest(unittest.TestCase):
+    def test_blank_lines_skipped_and_short_rows_padded(self):
+        src = (
+            "Key,Id,English(en),French(fr),German(de)\r\n"
+            "a,1,Hello,,\r\n"
+            "\r\n"
+            "b,2,\"Hi, there\"\r\n"
+            "c,3,Bye,Au revoir,Tschüss\r\n"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            in_path = os.path.join(tmp, "in.csv")
+            out_path = os.path.join(tmp, "out.csv")
+            with open(in_path, "w", encoding="utf-8-sig", newline="") as f:
+                f.write(src)
+
+            rows, fieldnames = load_csv(in_path)
+            self.assertEqual(fieldnames, ["Key", "Id", "English(en)", "French(fr)", "German(de)"])
+            self.assertEqual(rows, [
+                ["a", "1", "Hello", "", ""],
+                ["b", "2", "Hi, there", "", ""],
+                ["c", "3", "Bye", "Au revoir", "Tschüss"],
+            ])
+
+            write_csv(out_path, fieldnames, rows)
+            with open(out_path, "r", encoding="utf-8-sig", newline="") as f:
+                written = f.read()
+            self.assertEqual(written, (
+                "Key,Id,English(en),French(fr),German(de)\r\n"
+                "a,1,Hello,,\r\n"
+                "b,2,\"Hi, there\",,\r\n"
+                "c,3,Bye,Au revoir,Tschüss\r\n"
+            ))
+            self.assertEqual(load_csv(out_path), (rows, fieldnames))
+
+
+class IterBatchesTest(unittest.TestCase):
+    def test_caps_count(self):
+        texts = [f"t{i}" for i in range(DEEPL_BATCH_SIZE * 2 + 1)]
+        batches = list(iter_batches(texts))
+        self.assertEqual([len(b) for b in batches], [DEEPL_BATCH_SIZE, DEEPL_BATCH_SIZE, 1])
+        self.assertEqual(sum(batches, []), texts)
+
+    def test_caps_request_size(self):
+        # 非 ASCII 按 JSON 转义后的长度计（每字 6 字节）
+        texts = ["中" * 5000 for _ in range(10)]
+        batches = list(iter_batches(texts))
+        self.assertGreater(len(batches), 1)
+        self.assertEqual(sum(batches, []), texts)
+        for b in batches:
+            self.assertLessEqual(sum(len(t) * 6 + 3 for t in b), DEEPL_MAX_REQUEST_BYTES)
+
+    def test_oversized_text_is_its_own_batch(self):
+        huge = "a" * (DEEPL_MAX_REQUEST_BYTES + 1)
+        self.assertEqual(list(iter_batches(["x", huge, "y"])), [["x"], [huge], ["y"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
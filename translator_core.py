@@ -20,13 +20,23 @@ import os
 import re
 import csv
 import time
-from typing import Dict, List, Tuple, Any, Match, Optional, Sequence, Callable
+import json
+import asyncio
+import threading
+from functools import partial
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, List, Tuple, Any, Match, Optional, Sequence, Callable, Iterable, Iterator, Union, NamedTuple
 
 try:
     import deepl  # pip install deepl
 except ImportError:
     deepl = None
 
+try:
+    from requests.adapters import HTTPAdapter  # deepl 的依赖
+except ImportError:
+    HTTPAdapter = None
+
 
 # 语言映射（与原 translate.py 保持一致）
 LANG_HEADER_TO_DEEPL = {
@@ -48,20 +58,32 @@ KEY_COL = "Key"
 ID_COL = "Id"
 DEFAULT_SOURCE_COL = "English(en)"
 
-URL_RE = re.compile(r"^(https?://|www\.)", re.IGNORECASE)
-ONLY_PUNCT_OR_SPACE_RE = re.compile(r"^[\W_]+$", re.UNICODE)
-ONLY_DIGITS_RE = re.compile(r"^\d+(\.\d+)?$")
+# 无需翻译的源文本：空白 / URL 开头 / 纯数字 / 纯标点，单次匹配
+SKIP_RE = re.compile(
+    r"\A\s*(?:\Z|https?://|www\.|\d+(?:\.\d+)?\s*\Z|[\W_]+\s*\Z)",
+    re.IGNORECASE | re.UNICODE,
+)
 
-PLACEHOLDER_PATTERNS = [
-    re.compile(r"\{[^}]*\}"),  # {0}, {name}
-    re.compile(r"%[sdif]"),    # %s, %d, %i, %f
-    re.compile(r"\$\d+"),      # $1, $2
-]
+# {0}, {name} | %s, %d, %i, %f | $1, $2 —— 合并为一个模式，单次扫描
+COMBINED_PLACEHOLDER_RE = re.compile(r"(\{[^}]*\}|%[sdif]|\$\d+)")
 
 TOKEN_PREFIX = "§§PH_"
 TOKEN_SUFFIX = "§§"
+TOKEN_RE = re.compile(re.escape(TOKEN_PREFIX) + r"(\d+)" + re.escape(TOKEN_SUFFIX))
+
+# DeepL 单次请求最多接受 50 条 text、请求体不超过 128 KiB；留出余量按 100 KiB 切分
+DEEPL_BATCH_SIZE = 50
+DEEPL_MAX_REQUEST_BYTES = 100 * 1024
+MAX_CONCURRENT_REQUESTS = 16
+# 读取 / 写出文件的线程数。解析与回填是纯 Python、受 GIL 限制，
+# 多线程只能让磁盘 I/O 与其他工作重叠，不会随文件数线性加速，2 个足够
+MAX_FILE_WORKERS = 2
+WRITE_BUFFER_SIZE = 1024 * 1024
 
 Logger = Callable[[str], None]
+# (tokenized, target_lang) -> 译文 / 失败原因（gather 可能返回 CancelledError 等 BaseException）
+Translations = Dict[Tuple[str, str], str]
+Failures = Dict[Tuple[str, str], BaseException]
 
 
 def ensure_directories(input_dir: str, output_dir: str) -> None:
@@ -69,54 +91,57 @@ def ensure_directories(input_dir: str, output_dir: str) -> None:
     os.makedirs(output_dir, exist_ok=True)
 
 
-def load_csv(path: str) -> Tuple[List[Dict[str, str]], List[str]]:
+def load_csv(path: str) -> Tuple[List[List[str]], List[str]]:
+    """
+    读取 CSV，行以 list[str] 形式返回（按列下标访问），空行跳过。
+    比表头短的行补齐空字符串，保证目标列下标始终有效。
+    """
     with open(path, "r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
-        rows: List[Dict[str, str]] = list(reader)
-        raw_headers: Optional[Sequence[str]] = reader.fieldnames
-        fieldnames: List[str] = list(raw_headers) if raw_headers else []
+        reader = csv.reader(f)
+        fieldnames: List[str] = next(reader, [])
+        # 与 DictReader 一致：跳过空行
+        rows: List[List[str]] = [r for r in reader if r]
+    width = len(fieldnames)
+    for row in rows:
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
     return rows, fieldnames
 
 
-def write_csv(path: str, fieldnames: List[str], rows: List[Dict[str, Any]]) -> None:
-    with open(path, "w", encoding="utf-8-sig", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, quoting=csv.QUOTE_MINIMAL)
-        writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
+def write_csv(path: str, fieldnames: List[str], rows: List[List[str]]) -> None:
+    # 1 MiB 写缓冲，减少网络共享目录上的系统调用次数
+    with open(path, "w", encoding="utf-8-sig", newline="", buffering=WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
 
 
-def detect_language_columns(fieldnames: List[str], source_col: str) -> Tuple[str, Dict[str, str]]:
+def detect_language_columns(fieldnames: List[str], source_col: str) -> Tuple[int, Dict[int, str]]:
+    """
+    返回 (source_idx, targets_idx)，targets_idx 为 列下标 -> DeepL 语言代码。
+    """
     if source_col not in fieldnames:
         raise ValueError(f"Source column '{source_col}' not found in CSV headers.")
-    targets: Dict[str, str] = {}
-    for h in fieldnames:
+    targets: Dict[int, str] = {}
+    for i, h in enumerate(fieldnames):
         if h in (KEY_COL, ID_COL, source_col):
             continue
         code = LANG_HEADER_TO_DEEPL.get(h)
         if code:
-            targets[h] = code
+            targets[i] = code
     if not targets:
         raise ValueError("No translatable language columns detected from headers.")
-    return source_col, targets
+    return fieldnames.index(source_col), targets
 
 
 def is_skippable_source(text: str) -> bool:
-    if text is None:
-        return True
-    t = text.strip()
-    if not t:
-        return True
-    if URL_RE.match(t):
-        return True
-    if ONLY_DIGITS_RE.match(t):
-        return True
-    if ONLY_PUNCT_OR_SPACE_RE.match(t):
-        return True
-    return False
+    return text is None or SKIP_RE.match(text) is not None
 
 
 def tokenize_placeholders(text: str) -> Tuple[str, Dict[str, str]]:
+    if COMBINED_PLACEHOLDER_RE.search(text) is None:
+        return text, {}
+
     mapping: Dict[str, str] = {}
     token_index = 0
 
@@ -128,17 +153,15 @@ def tokenize_placeholders(text: str) -> Tuple[str, Dict[str, str]]:
         token_index += 1
         return token
 
-    tokenized = text
-    for pattern in PLACEHOLDER_PATTERNS:
-        tokenized = pattern.sub(repl, tokenized)
+    tokenized = COMBINED_PLACEHOLDER_RE.sub(repl, text)
     return tokenized, mapping
 
 
 def detokenize_placeholders(text: str, mapping: Dict[str, str]) -> str:
-    out = text
-    for token, original in mapping.items():
-        out = out.replace(token, original)
-    return out
+    if not mapping:
+        return text
+    # 单次扫描还原所有占位符；未知 token 原样保留
+    return TOKEN_RE.sub(lambda m: mapping.get(m.group(0), m.group(0)), text)
 
 
 def translate_text(
@@ -148,103 +171,380 @@ def translate_text(
     max_retries: int = 5,
     base_delay: float = 0.8,
 ) -> str:
-    last_error = None
-    for attempt in range(max_retries):
+    return translate_batch(translator, [text], target_lang, max_retries, base_delay)[0]
+
+
+def _request_size(text: str) -> int:
+    # deepl 以 JSON（ensure_ascii）发送 text 数组，非 ASCII 字符会被转义成 \\uXXXX
+    return len(json.dumps(text)) + 1
+
+
+def iter_batches(texts: Sequence[str]) -> Iterator[List[str]]:
+    """
+    按条数（DEEPL_BATCH_SIZE）与请求体大小（DEEPL_MAX_REQUEST_BYTES）切分 texts。
+    单条超限的文本自成一批。
+    """
+    batch: List[str] = []
+    size = 0
+    for text in texts:
+        n = _request_size(text)
+        if batch and (len(batch) >= DEEPL_BATCH_SIZE or size + n > DEEPL_MAX_REQUEST_BYTES):
+            yield batch
+            batch = []
+            size = 0
+        batch.append(text)
+        size += n
+    if batch:
+        yield batch
+
+
+def is_rejected_request(error: BaseException) -> bool:
+    """
+    DeepL 拒绝了请求本身（400 Bad Request、413 请求体过大等）：重试无意义，拆小后可能成功。
+    认证失败（403）、限流（429）、额度用尽（456）不算。
+    """
+    status = getattr(error, "http_status_code", None)
+    return status is not None and 400 <= status < 500 and status not in (403, 429, 456)
+
+
+def translate_batch(
+    translator: Any,
+    texts: List[str],
+    target_lang: str,
+    max_retries: int = 5,
+    base_delay: float = 0.8,
+) -> List[str]:
+    """
+    同步批量翻译：按 iter_batches 切片，每片一次 HTTP 请求，返回与 texts 等长、顺序一致的译文。
+    被 DeepL 拒绝的请求不重试，直接抛出原异常（见 is_rejected_request）。
+    """
+    out: List[str] = []
+    for chunk in iter_batches(texts):
+        last_error = None
+        for attempt in range(max_retries):
+            try:
+                results = translator.translate_text(
+                    chunk,
+                    target_lang=target_lang,
+                    source_lang="EN",
+                    preserve_formatting=True,
+                    split_sentences="nonewlines",
+                    formality="default",
+                )
+                out.extend(r.text if hasattr(r, "text") else str(r) for r in results)
+                break
+            except Exception as e:
+                if is_rejected_request(e):
+                    raise
+                last_error = e
+                time.sleep(base_delay * (2 ** attempt))
+        else:
+            raise RuntimeError(f"Translation failed after {max_retries} retries: {last_error}")
+    return out
+
+
+async def translate_text_async(
+    translator: Any,
+    texts: List[str],
+    target_lang: str,
+    semaphore: asyncio.Semaphore,
+    max_retries: int = 5,
+    base_delay: float = 0.8,
+    executor: Optional[Executor] = None,
+) -> List[str]:
+    """
+    translate_batch 的异步包装：阻塞调用放到 executor 线程中执行，由 semaphore 限制同时在途的请求数。
+    executor 的线程数应不小于 semaphore 的上限，否则实际并发会被默认线程池（min(32, cpu+4)）卡住。
+    """
+    loop = asyncio.get_running_loop()
+    async with semaphore:
+        return await loop.run_in_executor(
+            executor, translate_batch, translator, texts, target_lang, max_retries, base_delay
+        )
+
+
+# 与一批 texts 等长：每项是译文，或该条文本的失败原因
+BatchResult = List[Union[str, BaseException]]
+
+
+class _BatchDispatcher:
+    """
+    按目标语言积攒待翻译文本，满 DEEPL_BATCH_SIZE 条或接近请求体上限即发出请求；
+    调用方可以边读文件边 add，网络请求与后续文件的读取重叠进行。
+    需在事件循环内使用。
+    """
+
+    def __init__(self, translator: Any):
+        self.translator = translator
+        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # 专用线程池，保证真正能有 MAX_CONCURRENT_REQUESTS 个请求同时在途
+        self.pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+        self.seen: Dict[Tuple[str, str], None] = {}
+        self.buffers: Dict[str, List[str]] = {}
+        self.buffer_sizes: Dict[str, int] = {}
+        self.batches: List[Tuple[str, List[str]]] = []
+        self.tasks: List["asyncio.Future[BatchResult]"] = []
+
+    def add(self, keys: Iterable[Tuple[str, str]]) -> None:
+        for key in keys:
+            if key in self.seen:
+                continue
+            self.seen[key] = None
+            text, target_lang = key
+            n = _request_size(text)
+            if target_lang in self.buffers and self.buffer_sizes[target_lang] + n > DEEPL_MAX_REQUEST_BYTES:
+                self._dispatch(target_lang)
+            buf = self.buffers.setdefault(target_lang, [])
+            buf.append(text)
+            self.buffer_sizes[target_lang] = self.buffer_sizes.get(target_lang, 0) + n
+            if len(buf) >= DEEPL_BATCH_SIZE:
+                self._dispatch(target_lang)
+
+    def _dispatch(self, target_lang: str) -> None:
+        texts = self.buffers.pop(target_lang)
+        del self.buffer_sizes[target_lang]
+        self.batches.append((target_lang, texts))
+        self.tasks.append(asyncio.ensure_future(self._translate_or_split(texts, target_lang)))
+
+    async def _translate_or_split(self, texts: List[str], target_lang: str) -> BatchResult:
+        """
+        翻译一批文本。若 DeepL 拒绝整批请求，二分后分别重试，
+        使一条有问题的文本不会连累同批的其他文本。
+        """
         try:
-            result = translator.translate_text(
-                text,
-                target_lang=target_lang,
-                source_lang="EN",
-                preserve_formatting=True,
-                split_sentences="nonewlines",
-                formality="default",
+            result = await translate_text_async(
+                self.translator, texts, target_lang, self.semaphore, executor=self.pool
             )
-            return result.text if hasattr(result, "text") else str(result)
         except Exception as e:
-            last_error = e
-            time.sleep(base_delay * (2 ** attempt))
-    raise RuntimeError(f"Translation failed after {max_retries} retries: {last_error}")
+            if len(texts) == 1 or not is_rejected_request(e):
+                return [e] * len(texts)
+            mid = len(texts) // 2
+            left, right = await asyncio.gather(
+                self._translate_or_split(texts[:mid], target_lang),
+                self._translate_or_split(texts[mid:], target_lang),
+            )
+            return left + right
+
+        out: BatchResult = list(result[:len(texts)])
+        if len(result) != len(texts):
+            # 返回条数与请求不符：对上的照常使用，缺失部分记为失败
+            shortfall = RuntimeError(f"DeepL returned {len(result)} translations for {len(texts)} texts")
+            out.extend([shortfall] * (len(texts) - len(result)))
+        return out
+
+    async def collect(
+        self,
+        logger: Optional[Logger] = None,
+    ) -> Tuple[Translations, Failures]:
+        # 发出剩余不满一批的文本，再等待全部请求完成
+        for target_lang in list(self.buffers):
+            self._dispatch(target_lang)
+
+        if logger:
+            logger(f"Translating {len(self.seen)} unique texts in {len(self.batches)} requests...")
+
+        try:
+            results = await asyncio.gather(*self.tasks, return_exceptions=True)
+        finally:
+            self.pool.shutdown(wait=False)
+
+        translations: Translations = {}
+        failures: Failures = {}
+        for (target_lang, texts), result in zip(self.batches, results):
+            items: BatchResult = [result] * len(texts) if isinstance(result, BaseException) else result
+            failed = 0
+            first_error = None
+            for text, item in zip(texts, items):
+                if isinstance(item, BaseException):
+                    failures[(text, target_lang)] = item
+                    failed += 1
+                    first_error = first_error or item
+                else:
+                    translations[(text, target_lang)] = item
+            if logger:
+                if failed:
+                    logger(f"  -> Batch of {len(texts)} texts to {target_lang}: {failed} FAILED: {first_error}")
+                else:
+                    logger(f"  -> Batch of {len(texts)} texts to {target_lang}: API call success")
+        return translations, failures
+
+
+async def _translate_all_async(
+    translator: Any,
+    keys: Sequence[Tuple[str, str]],
+    logger: Optional[Logger] = None,
+) -> Tuple[Translations, Failures]:
+    dispatcher = _BatchDispatcher(translator)
+    dispatcher.add(keys)
+    return await dispatcher.collect(logger)
+
+
+def translate_all(
+    translator: Any,
+    keys: Sequence[Tuple[str, str]],
+    logger: Optional[Logger] = None,
+) -> Tuple[Translations, Failures]:
+    """
+    并发翻译一组去重后的 (tokenized, target_lang)。
+    按目标语言分组、每 DEEPL_BATCH_SIZE 条一个请求，最多 MAX_CONCURRENT_REQUESTS 个请求同时在途。
+    返回 (translations, failures)，两者均以 (tokenized, target_lang) 为键。
+    """
+    if not keys:
+        return {}, {}
+    return asyncio.run(_translate_all_async(translator, keys, logger))
+
 
+def configure_http_session(translator: Any, pool_size: int = MAX_CONCURRENT_REQUESTS) -> None:
+    """
+    扩大 deepl.Translator 内部 requests.Session 的连接池，让并发请求都复用 keep-alive 连接
+    （requests 默认池大小为 10，超出的连接用完即丢，下次请求要重新做 TCP/TLS 握手）。
+    Translator 的所有请求都走这一个 Session，因此可在多个线程间共享。
+    依赖 deepl 的内部属性，取不到时直接跳过。
+    """
+    session = getattr(getattr(translator, "_client", None), "_session", None)
+    if HTTPAdapter is None or session is None:
+        return
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
 
-def should_fill_cell(current_value: Any, preserve_existing: bool) -> bool:
+
+def should_fill_cell(current_value: Optional[str], preserve_existing: bool) -> bool:
+    # load_csv 产出的单元格总是 str，无需再 str() 转换
     if not preserve_existing:
         return True
-    if current_value is None:
-        return True
-    if str(current_value).strip() == "":
+    if current_value is None or not current_value:
         return True
-    return False
+    return not current_value.strip()
 
 
-def process_rows(
-    rows: List[Dict[str, Any]],
-    source_col: str,
-    targets_map: Dict[str, str],
-    translator: Any,
-    preserve_existing: bool = True,
-    logger: Optional[Logger] = None,
-) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
-    cache: Dict[Tuple[str, str], str] = {}
-    stats = {
-        "rows": len(rows),
+# ((目标列下标, DeepL 语言代码), ...)，每个文件构建一次供逐行循环使用
+TargetSeq = Tuple[Tuple[int, str], ...]
+WorkItem = Tuple[int, List[str], int, Tuple[str, str], Dict[str, str]]
+
+
+class LoadedFile(NamedTuple):
+    """一个已读取、已收集待翻译文本的 CSV 文件。"""
+    filename: str
+    fieldnames: List[str]
+    rows: List[List[str]]
+    work: List[WorkItem]
+    stats: Dict[str, int]
+    pending: Dict[Tuple[str, str], None]
+
+
+def new_stats(row_count: int) -> Dict[str, int]:
+    return {
+        "rows": row_count,
         "translated_cells": 0,
         "skipped_existing": 0,
         "skipped_source_invalid": 0,
         "errors": 0,
     }
 
-    new_rows: List[Dict[str, Any]] = []
+
+def collect_pending(
+    rows: List[List[str]],
+    source_idx: int,
+    targets_seq: TargetSeq,
+    pending: Dict[Tuple[str, str], None],
+    stats: Dict[str, int],
+    preserve_existing: bool = True,
+) -> List[WorkItem]:
+    """
+    第一遍：找出需要翻译的单元格。
+    去重后的 (tokenized, target_lang) 写入 pending（可跨文件共享），返回回填所需的工作列表。
+    """
+    work: List[WorkItem] = []
+
+    # 耗时在网络 I/O（已批量化），不在字节码，Numba/Cython 之类的 JIT 帮不上忙；
+    # 这里只把热循环里的全局函数 / 方法查找绑定为局部变量。
+    _skippable = is_skippable_source
+    _tokenize = tokenize_placeholders
+    _should_fill = should_fill_cell
+    _append = work.append
+    skipped_source = 0
+    skipped_existing = 0
 
     for idx, row in enumerate(rows, start=1):
-        source_text = row.get(source_col, "")
-        if is_skippable_source(source_text):
-            stats["skipped_source_invalid"] += 1
-            new_rows.append(row)
+        source_text = row[source_idx]
+        if _skippable(source_text):
+            skipped_source += 1
             continue
 
-        tokenized, mapping = tokenize_placeholders(source_text)
+        tokenized, mapping = _tokenize(source_text)
 
-        for header, target_lang in targets_map.items():
-            current_value = row.get(header, "")
-            if not should_fill_cell(current_value, preserve_existing):
-                stats["skipped_existing"] += 1
+        for tgt_idx, target_lang in targets_seq:
+            if not _should_fill(row[tgt_idx], preserve_existing):
+                skipped_existing += 1
                 continue
 
-            if logger:
-                snippet = (source_text or "").strip()
-                if len(snippet) > 60:
-                    snippet = snippet[:60] + "..."
-                logger(f"Translating row {idx} to {target_lang}: '{snippet}'")
-
             key_cache = (tokenized, target_lang)
-            try:
-                if key_cache in cache:
-                    translated = cache[key_cache]
-                    if logger:
-                        logger("  -> Cache hit")
-                else:
-                    translated = translate_text(translator, tokenized, target_lang)
-                    cache[key_cache] = translated
-                    if logger:
-                        logger("  -> API call success")
-
-                detok = detokenize_placeholders(translated, mapping)
-                if str(detok).strip() != "":
-                    row[header] = detok
-                    stats["translated_cells"] += 1
-                    if logger:
-                        out_snippet = detok.strip()
-                        if len(out_snippet) > 60:
-                            out_snippet = out_snippet[:60] + "..."
-                        logger(f"  -> Filled '{header}': '{out_snippet}'")
-            except Exception as e:
-                stats["errors"] += 1
-                if logger:
-                    logger(f"  -> FAILED for '{header}': {e}")
+            pending[key_cache] = None
+            _append((idx, row, tgt_idx, key_cache, mapping))
 
-        new_rows.append(row)
+    stats["skipped_source_invalid"] += skipped_source
+    stats["skipped_existing"] += skipped_existing
+    return work
 
-    return new_rows, stats
+
+def apply_translations(
+    work: List[WorkItem],
+    translations: Translations,
+    failures: Failures,
+    stats: Dict[str, int],
+    logger: Optional[Logger] = None,
+    filename: str = "",
+) -> None:
+    """
+    第二遍：只做字典查找与占位符还原，把译文写回行中。
+    filename 会写进逐行日志，多个文件并行回填时可以区分来源。
+    """
+    _detokenize = detokenize_placeholders
+    row_label = f"{filename} row" if filename else "Row"
+    translated_cells = 0
+    errors = 0
+
+    for idx, row, tgt_idx, key_cache, mapping in work:
+        if key_cache in failures:
+            errors += 1
+            if logger is not None:
+                logger(f"  -> {row_label} {idx} FAILED for {key_cache[1]}: {failures[key_cache]}")
+            continue
+
+        translated = translations.get(key_cache)
+        if translated is None:
+            errors += 1
+            if logger is not None:
+                logger(f"  -> {row_label} {idx} FAILED for {key_cache[1]}: no translation returned")
+            continue
+        detok = _detokenize(translated, mapping)
+        if detok.strip():
+            row[tgt_idx] = detok
+            translated_cells += 1
+            if logger is not None:
+                out_snippet = detok.strip()
+                if len(out_snippet) > 60:
+                    out_snippet = out_snippet[:60] + "..."
+                logger(f"  -> {row_label} {idx} filled {key_cache[1]}: '{out_snippet}'")
+
+    stats["translated_cells"] += translated_cells
+    stats["errors"] += errors
+
+
+def process_rows(
+    rows: List[List[str]],
+    source_idx: int,
+    targets_seq: TargetSeq,
+    translator: Any,
+    preserve_existing: bool = True,
+    logger: Optional[Logger] = None,
+) -> Tuple[List[List[str]], Dict[str, int]]:
+    stats = new_stats(len(rows))
+    pending: Dict[Tuple[str, str], None] = {}
+    work = collect_pending(rows, source_idx, targets_seq, pending, stats, preserve_existing)
+    translations, failures = translate_all(translator, list(pending), logger)
+    apply_translations(work, translations, failures, stats, logger)
+    return rows, stats
 
 
 def test_api_key(api_key: str) -> Tuple[bool, str]:
@@ -284,9 +584,13 @@ def run_translation_for_folder(
     logger: 可选的回调函数，用于输出进度日志。
     返回一个汇总统计：{files, rows, translated_cells, skipped_existing, skipped_source_invalid, errors}
     """
+    log_lock = threading.Lock()
+
     def log(msg: str) -> None:
+        # 文件在多个线程中处理，串行化日志回调
         if logger:
-            logger(msg)
+            with log_lock:
+                logger(msg)
 
     ensure_directories(input_dir, output_dir)
 
@@ -297,6 +601,7 @@ def run_translation_for_folder(
         raise RuntimeError("Missing DeepL API Key.")
 
     translator = deepl.Translator(api_key)
+    configure_http_session(translator)
 
     # 收集文件
     all_files = [
@@ -304,58 +609,98 @@ def run_translation_for_folder(
         if f.lower().endswith(".csv") and os.path.isfile(os.path.join(input_dir, f))
     ]
 
-    summary = {
-        "files": 0,
-        "rows": 0,
-        "translated_cells": 0,
-        "skipped_existing": 0,
-        "skipped_source_invalid": 0,
-        "errors": 0,
-    }
+    summary = {"files": 0, **new_stats(0)}
 
     if not all_files:
         log("No CSV files found in input directory. Please add files and try again.")
         return summary
 
     log(f"Found {len(all_files)} CSV files, starting...")
-    for idx, filename in enumerate(all_files, start=1):
+
+    def load_file(idx: int, filename: str) -> Optional[LoadedFile]:
         in_path = os.path.join(input_dir, filename)
-        out_path = os.path.join(output_dir, filename)
 
-        log(f"[{idx}/{len(all_files)}] Processing file: {filename}")
+        log(f"[{idx}/{len(all_files)}] Loading file: {filename}")
         try:
             rows, fieldnames = load_csv(in_path)
-            source, targets_map = detect_language_columns(fieldnames, source_col)
+            source_idx, targets_idx = detect_language_columns(fieldnames, source_col)
+            targets_seq: TargetSeq = tuple(targets_idx.items())
 
-            new_rows, stats = process_rows(
+            stats = new_stats(len(rows))
+            file_pending: Dict[Tuple[str, str], None] = {}
+            work = collect_pending(
                 rows,
-                source,
-                targets_map,
-                translator,
+                source_idx,
+                targets_seq,
+                file_pending,
+                stats,
                 preserve_existing=not overwrite_existing,
-                logger=log,
             )
+            return LoadedFile(filename, fieldnames, rows, work, stats, file_pending)
+        except Exception as e:
+            log(f" - Failed to process {filename}: {e}")
+            return None
+
+    def finish_file(
+        entry: LoadedFile,
+        translations: Translations,
+        failures: Failures,
+    ) -> Optional[Dict[str, int]]:
+        filename, stats = entry.filename, entry.stats
+        out_path = os.path.join(output_dir, filename)
 
-            write_csv(out_path, fieldnames, new_rows)
+        try:
+            apply_translations(entry.work, translations, failures, stats, log, filename)
+            write_csv(out_path, entry.fieldnames, entry.rows)
 
-            # Logs & summary
-            log(f" - Rows: {stats['rows']}, Translated cells: {stats['translated_cells']}, "
+            log(f"Wrote {filename} - Rows: {stats['rows']}, Translated cells: {stats['translated_cells']}, "
                 f"Skipped invalid sources: {stats['skipped_source_invalid']}, Errors: {stats['errors']}"
                 + (f", Preserved existing: {stats['skipped_existing']}" if not overwrite_existing else ""))
+            return stats
+        except Exception as e:
+            log(f" - Failed to process {filename}: {e}")
+            return None
+
+    async def load_and_translate(
+        ex: ThreadPoolExecutor,
+    ) -> Tuple[List[LoadedFile], Translations, Failures]:
+        # 所有文件同时提交到线程池读取；按文件顺序取结果，
+        # 每读完一个就把新文本交给 dispatcher，请求与后续文件的读取重叠
+        loop = asyncio.get_running_loop()
+        futures = [
+            loop.run_in_executor(ex, load_file, idx, filename)
+            for idx, filename in enumerate(all_files, start=1)
+        ]
+        dispatcher = _BatchDispatcher(translator)
+        loaded: List[LoadedFile] = []
+        for fut in futures:
+            entry = await fut
+            if entry is None:
+                summary["errors"] += 1
+                continue
+            loaded.append(entry)
+            dispatcher.add(entry.pending)
+
+        # 每个 (tokenized, target_lang) 只翻译一次
+        translations, failures = await dispatcher.collect(log)
+        return loaded, translations, failures
 
+    with ThreadPoolExecutor(max_workers=MAX_FILE_WORKERS) as ex:
+        loaded, translations, failures = asyncio.run(load_and_translate(ex))
+
+        # 写出同样交给线程池，离开 with 时等待全部写完
+        finish = partial(finish_file, translations=translations, failures=failures)
+        for stats in ex.map(finish, loaded):
+            if stats is None:
+                summary["errors"] += 1
+                continue
             summary["files"] += 1
-            summary["rows"] += stats["rows"]
-            summary["translated_cells"] += stats["translated_cells"]
-            summary["skipped_existing"] += stats["skipped_existing"]
-            summary["skipped_source_invalid"] += stats["skipped_source_invalid"]
-            summary["errors"] += stats["errors"]
-        except Exception as e:
-            log(f" - Failed to process: {e}")
-            summary["errors"] += 1
+            for k, v in stats.items():
+                summary[k] += v
 
     log("All processing completed.")
     log(f"Files: {summary['files']}, Total rows: {summary['rows']}, "
         f"Translated cells: {summary['translated_cells']}, Errors: {summary['errors']}")
     if not overwrite_existing:
         log(f"Preserved existing cells count: {summary['skipped_existing']}")
-    return summary
\ No newline at end of file
+    return summary